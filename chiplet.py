@@ -1,5 +1,7 @@
 import time
 import random
+from functools import partial
+from typing import Callable
 
 from register import Register
 from memory import Memory
@@ -8,6 +10,73 @@ from keyboard import Keyboard
 from screen import Screen
 from romloader import RomLoader
 
+# the number of instructions executed per frame of the emulator
+CYCLES_PER_FRAME = 10
+
+# the delay between two frames in milliseconds (~60 Hz)
+FRAME_DELAY_MS = 16
+
+# the rate at which the delay and sound timers count down
+TIMER_HZ = 60
+
+# the default character set, 5 bytes per hexadecimal digit, loaded at address 0
+DEFAULT_FONT = bytes((
+    0xF0, 0x90, 0x90, 0x90, 0xF0,
+    0x20, 0x60, 0x20, 0x20, 0x70,
+    0xF0, 0x10, 0xF0, 0x80, 0xF0,
+    0xF0, 0x10, 0xF0, 0x10, 0xF0,
+    0x90, 0x90, 0xF0, 0x10, 0x10,
+    0xF0, 0x80, 0xF0, 0x10, 0xF0,
+    0xF0, 0x80, 0xF0, 0x90, 0xF0,
+    0xF0, 0x10, 0x20, 0x40, 0x40,
+    0xF0, 0x90, 0xF0, 0x90, 0xF0,
+    0xF0, 0x90, 0xF0, 0x10, 0xF0,
+    0xF0, 0x90, 0xF0, 0x90, 0x90,
+    0xE0, 0x90, 0xE0, 0x90, 0xE0,
+    0xF0, 0x80, 0x80, 0x80, 0xF0,
+    0xE0, 0x90, 0x90, 0x90, 0xE0,
+    0xF0, 0x80, 0xF0, 0x80, 0xF0,
+    0xF0, 0x80, 0xF0, 0x80, 0x80,
+))
+
+# the three BCD digits of every byte value, as stored by the FX33 instruction
+_BCD = [bytes((value // 100, (value // 10) % 10, value % 10)) for value in range(256)]
+
+
+def _no_operands(opcode: int) -> tuple:
+    """Operands of an opcode without operands."""
+    return ()
+
+
+def _operands_nnn(opcode: int) -> tuple:
+    """Operands of an opcode of the form _NNN."""
+    return (opcode & 0x0FFF,)
+
+
+def _operands_x(opcode: int) -> tuple:
+    """Operands of an opcode of the form _X__."""
+    return ((opcode & 0x0F00) >> 8,)
+
+
+def _operands_xkk(opcode: int) -> tuple:
+    """Operands of an opcode of the form _XKK."""
+    return ((opcode & 0x0F00) >> 8, opcode & 0x00FF)
+
+
+def _operands_xy(opcode: int) -> tuple:
+    """Operands of an opcode of the form _XY_."""
+    return ((opcode & 0x0F00) >> 8, (opcode & 0x00F0) >> 4)
+
+
+def _operands_xyn(opcode: int) -> tuple:
+    """Operands of an opcode of the form _XYN."""
+    return ((opcode & 0x0F00) >> 8, (opcode & 0x00F0) >> 4, opcode & 0x000F)
+
+
+def _bind(handler: Callable[..., None]) -> Callable[..., Callable[[], None]]:
+    """Builder of the instructions binding a handler to their operands."""
+    return partial(partial, handler)
+
 
 class Chip:
     """
@@ -25,18 +94,42 @@ class Chip:
     :type _screen_multiplier: int
     :ivar _register: Instance of a general purpose register set of the Chip-8 system.
     :type _register: Register
+    :ivar _v: The bytearray of the V registers of `_register`, accessed directly in the hot path.
+    :type _v: bytearray
+    :ivar _decoded: Decoded-instruction cache mapping an address to its decoded entry.
+    :type _decoded: list
     :ivar _memory: Emulation of the Chip-8 memory (4 KB in total).
     :type _memory: Memory
+    :ivar _mem: The bytearray backing `_memory`, accessed directly in the hot path.
+    :type _mem: bytearray
     :ivar _stack: An abstraction of the stack used to manage subroutine calls.
     :type _stack: Stack
+    :ivar _primary: Instruction builders indexed by the highest nibble of an opcode.
+    :type _primary: list
+    :ivar _secondary: Sub-tables and their key masks for the 0x0, 0x8, 0xE and 0xF opcodes.
+    :type _secondary: dict
+    :ivar _rng: The random number generator of the CXKK instruction.
+    :type _rng: random.Random
+    :ivar _rand_get: The bound `getrandbits` method of `_rng`.
+    :type _rand_get: Callable[[int], int]
     :ivar _keyboard: Simulated keyboard interface for Chip-8 key inputs.
     :type _keyboard: Keyboard
     :ivar _screen: Instance of the screen rendering and display handler.
     :type _screen: Screen
     :ivar _romloader: Component responsible for loading game/application ROMs.
     :type _romloader: RomLoader
+    :ivar _last_timer: The `time.perf_counter` value up to which the timers were counted down.
+    :type _last_timer: float
+    :ivar _waiting_key: Whether a wait-for-key instruction is waiting for a key press.
+    :type _waiting_key: bool
     """
 
+    __slots__ = (
+        "_screen_multiplier", "_register", "_v", "_decoded", "_memory", "_mem", "_stack",
+        "_primary", "_secondary", "_rng", "_rand_get", "_keyboard",
+        "_screen", "_romloader", "_last_timer", "_waiting_key",
+    )
+
     def __init__(self, game: str, screen_multiplier: int = 10):
         """
         Initialize the main Chip-8 emulator components and begin execution.
@@ -59,15 +152,34 @@ class Chip:
         # Initialize the registers
         self._register = Register()
 
-        # Initialize the memory
-        self._memory = Memory()
+        # the V registers, indexed directly by the instructions
+        self._v = self._register.v
+
+        # Decoded instructions indexed by address, filled at ROM load and on cache misses
+        self._decoded = [None] * 4096
+
+        # Initialize the memory, writes to it invalidate the decoded instructions
+        self._memory = Memory(self._decoded)
+
+        # the raw memory, indexed directly by the instructions
+        self._mem = self._memory.mem
 
         # Initialize the stack
-        self._stack = Stack(self._register)
+        self._stack = Stack()
+
+        # Build the dispatch tables of the opcode handlers
+        self._build_dispatch_tables()
+
+        # the random number generator of the CXKK instruction
+        self._rng = random.Random()
+        self._rand_get = self._rng.getrandbits
 
         # initialize the Keyboard
         self._keyboard = Keyboard()
 
+        # no wait-for-key instruction is waiting yet
+        self._waiting_key = False
+
         # Initialize the screen
         self._screen = Screen("Chip-8 Emulator", 64, 32, 10, self._keyboard)
 
@@ -80,67 +192,132 @@ class Chip:
         # Load the default character set
         self._load_default_character_set()
 
+        # the wall-clock time up to which the timers have been counted down
+        self._last_timer = time.perf_counter()
+
         # Execute Logic and write screen
         self.logic()
 
         # enter the mainloop
         self._screen.mainloop()
 
+    def _build_dispatch_tables(self) -> None:
+        """
+        Builds the tables used to look up the builder of an instruction by its opcode.
+
+        Each entry of the tables pairs a builder with the function extracting the
+        operands of the instruction from the opcode. The builders of the most frequent
+        opcodes are factories building a specialized closure per instruction, all other
+        handlers are bound to their operands with `functools.partial`. The primary table
+        holds one entry per highest nibble of an opcode. The entries of the 0x0, 0x8, 0xE
+        and 0xF groups are empty, their builders are looked up in a sub-table keyed by
+        the opcode masked with the mask stored next to the sub-table.
+
+        :return: None
+        """
+        self._primary = [
+            None,
+            (self._make_1nnn, _operands_nnn),
+            (self._make_2nnn, _operands_nnn),
+            (self._make_3xkk, _operands_xkk),
+            (self._make_4xkk, _operands_xkk),
+            (_bind(self._op_5xy0), _operands_xy),
+            (self._make_6xkk, _operands_xkk),
+            (self._make_7xkk, _operands_xkk),
+            None,
+            (_bind(self._op_9xy0), _operands_xy),
+            (self._make_annn, _operands_nnn),
+            (_bind(self._op_bnnn), _operands_nnn),
+            (_bind(self._op_cxkk), _operands_xkk),
+            (self._make_dxyn, _operands_xyn),
+            None,
+            None,
+        ]
+
+        # the 0x0 opcodes are matched completely
+        op0 = {
+            0x00E0: (_bind(self._op_00e0), _no_operands),
+            0x00EE: (self._make_00ee, _no_operands),
+        }
+
+        # the 0x8 opcodes are selected by the lowest nibble
+        op8 = {
+            0x0: (self._make_8xy0, _operands_xy),
+            0x1: (_bind(self._op_8xy1), _operands_xy),
+            0x2: (_bind(self._op_8xy2), _operands_xy),
+            0x3: (_bind(self._op_8xy3), _operands_xy),
+            0x4: (self._make_8xy4, _operands_xy),
+            0x5: (_bind(self._op_8xy5), _operands_xy),
+            0x6: (_bind(self._op_8xy6), _operands_x),
+            0x7: (_bind(self._op_8xy7), _operands_xy),
+            0xE: (_bind(self._op_8xye), _operands_x),
+        }
+
+        # the 0xE and 0xF opcodes are selected by the lowest byte
+        ope = {
+            0x9E: (self._make_ex9e, _operands_x),
+            0xA1: (self._make_exa1, _operands_x),
+        }
+        opf = {
+            0x07: (_bind(self._op_fx07), _operands_x),
+            0x0A: (_bind(self._op_fx0a), _operands_x),
+            0x15: (_bind(self._op_fx15), _operands_x),
+            0x18: (_bind(self._op_fx18), _operands_x),
+            0x1E: (_bind(self._op_fx1e), _operands_x),
+            0x29: (_bind(self._op_fx29), _operands_x),
+            0x33: (_bind(self._op_fx33), _operands_x),
+            0x55: (_bind(self._op_fx55), _operands_x),
+            0x65: (_bind(self._op_fx65), _operands_x),
+        }
+
+        self._secondary = {
+            0x0: (op0, 0xFFFF),
+            0x8: (op8, 0x000F),
+            0xE: (ope, 0x00FF),
+            0xF: (opf, 0x00FF),
+        }
+
     def _load_rom_data(self) -> None:
         """
         Loads the ROM data into memory, sets the memory data in a specific range,
         and initializes the program counter (PC) register to the designated
         starting address for execution. This process prepares the system for
         running applications by ensuring proper memory and register initialization.
+        The loaded program is pre-decoded into the decoded-instruction cache.
 
         :raises Exception: If loading ROM data or setting memory fails.
         :raises Exception: If program counter (PC) register initialization fails.
         """
         data = self._romloader.get_rom_data()
         self._memory.set_memory_range(512, data)
-        self._register.set_pc(0x200)
+        self._register.pc = 0x200
+
+        # pre-decode the ROM into the instruction cache
+        for pc in range(0x200, 0x200 + len(data), 2):
+            self._decoded[pc] = self._decode(self._read_short(pc))
 
     def _load_default_character_set(self) -> None:
         """
         Loads the default character set into memory.
 
         This method initializes the system by storing a predefined set of characters
-        into the system memory. The characters are represented as arrays of bytes and
-        are used as a default character set. Each byte in the predefined list is loaded
-        sequentially into memory at a predefined address.
+        into the system memory. The characters are represented as the immutable bytes
+        `DEFAULT_FONT` and are used as a default character set. The bytes are copied
+        into memory starting at address 0 in a single slice assignment.
 
         :raises MemoryError: If memory allocation fails.
         """
 
-        # the default character set
-        default_character_set = [0xF0, 0x90, 0x90, 0x90, 0xF0,
-                                 0x20, 0x60, 0x20, 0x20, 0x70,
-                                 0xF0, 0x10, 0xF0, 0x80, 0xF0,
-                                 0xF0, 0x10, 0xF0, 0x10, 0xF0,
-                                 0x90, 0x90, 0xF0, 0x10, 0x10,
-                                 0xF0, 0x80, 0xF0, 0x10, 0xF0,
-                                 0xF0, 0x80, 0xF0, 0x90, 0xF0,
-                                 0xF0, 0x10, 0x20, 0x40, 0x40,
-                                 0xF0, 0x90, 0xF0, 0x90, 0xF0,
-                                 0xF0, 0x90, 0xF0, 0x10, 0xF0,
-                                 0xF0, 0x90, 0xF0, 0x90, 0x90,
-                                 0xE0, 0x90, 0xE0, 0x90, 0xE0,
-                                 0xF0, 0x80, 0x80, 0x80, 0xF0,
-                                 0xE0, 0x90, 0x90, 0x90, 0xE0,
-                                 0xF0, 0x80, 0xF0, 0x80, 0xF0,
-                                 0xF0, 0x80, 0xF0, 0x80, 0x80,
-                                 ]
-
         # load the default characters into the memory
-        for i, byte in enumerate(default_character_set):
-            self._memory.set_memory(i, byte)
+        self._memory.set_memory_range(0, DEFAULT_FONT)
 
     def _read_short(self, index: int) -> int:
         """
         Reads a 16-bit short value from memory at the given index. The value is
         composed by reading two consecutive bytes from memory. The first byte
         is shifted 8 bits to the left, and the second byte is ORed with it to
-        form the final short value.
+        form the final short value. The second byte wraps around to address 0
+        at the end of the memory.
 
         :param index: The starting index in memory from which the 16-bit short
             value will be read.
@@ -148,301 +325,360 @@ class Chip:
         :return: A 16-bit integer value read from memory.
         :rtype: int
         """
-        return self._memory.get_memory(index) << 8 | self._memory.get_memory(index + 1)
+        return self._mem[index] << 8 | self._mem[(index + 1) & 0xFFF]
 
     def logic(self) -> None:
         """
-        Contains the implementation of a logic function responsible for processing
-        specific operational tasks and updating the current display of a screen.
+        Executes one frame of the emulator and schedules the next one.
 
-        The function ensures that a sequence of operations is correctly executed and the
-        result is visually reflected on the screen, maintaining state consistency.
+        A frame counts the delay and sound timers down, executes a batch of
+        ``CYCLES_PER_FRAME`` instructions and writes the screen once, so the cost of
+        the Tk event loop is paid per frame instead of per instruction. Frames are
+        scheduled at roughly 60 Hz; the timers are driven by the wall clock, so they
+        count down at ``TIMER_HZ`` even when frames run late.
 
         :return: None
         """
-        # clear the screen
-        # self._screen.clear()
-
-        # check if the delaytimer is set
-        delay_time = self._register.get_dt()
-        if delay_time > 0:
-            time.sleep(0.0001 * delay_time)
-            self._register.decrement_dt()
+        # count the timers down by the 60 Hz ticks elapsed since the last update
+        now = time.perf_counter()
+        ticks = int((now - self._last_timer) * TIMER_HZ)
+        if ticks > 0:
+            self._last_timer += ticks / TIMER_HZ
 
-        # play a sound if soundtimer is set
-        if self._register.get_st() > 0:
-            self._play_sound()
-            self._register.decrement_st()
+            # count the delay timer down
+            register = self._register
+            if register.dt > 0:
+                register.dt = max(register.dt - ticks, 0)
 
-        # read next data from
-        opcode = self._read_short(self._register.get_pc())
+            # play a sound if soundtimer is set
+            if register.st > 0:
+                self._play_sound()
+                register.st = max(register.st - ticks, 0)
 
-        # increment the programm counter
-        self._register.increment_pc()
-
-        # excute the opcode
-        self._execute_opcode(opcode)
+        # execute the instructions of this frame
+        self._run(CYCLES_PER_FRAME)
 
         # write to the canvas
         self._screen.write_screen()
 
-        # call the logic function again
-        self._screen.master.after(1, self.logic)
+        # call the logic function again for the next frame
+        self._screen.schedule_frame(self.logic, FRAME_DELAY_MS)
 
-    def _play_sound(self):
-        pass
-
-    def _execute_opcode(self, opcode: int) -> None:
+    def _run(self, cycles: int) -> None:
         """
-        Executes the given opcode by performing the associated operation.
+        Executes the given number of instructions in one batch.
 
-        This method handles specific operation codes defined by the system.
-        Each opcode matches a predefined functionality that can manipulate the screen,
-        the program counter, or other system components. Invalid opcodes (not explicitly
-        handled) are ignored.
+        Each instruction is fetched from the decoded-instruction cache, decoding it
+        on a cache miss, the program counter is advanced, wrapping around at the end
+        of the memory, and the handler of the instruction is called. Timers and the
+        screen are not touched, so callers decide how often those are updated
+        relative to the executed instructions.
 
-        :param opcode: The operation code to be executed.
-        :type opcode: int
+        :param cycles: The number of instructions to execute.
+        :type cycles: int
         :return: None
         """
-        match opcode:
-            case 0x00E0:
-                # Clear the screen
-                self._screen.clear_screen_array()
-            case 0x00EE:
-                # return from a subroutine
-                self._register.set_pc(self._stack.pop())
-            case _:
-                # execute extended opcodes
-                self._execute_extended(opcode)
-
-    def _execute_extended(self, opcode: int) -> None:
-        """
-        Executes the provided opcode by parsing its components and performing the relevant
-        operation. The operation is determined based on the highest nibble of the opcode
-        and can include actions such as modifying registers, skipping instructions,
-        manipulating the stack, or executing extended opcode sets.
+        # bind the attributes used by every instruction to locals
+        decoded = self._decoded
+        register = self._register
 
-        :param opcode: The 16-bit machine code instruction to be executed.
-        :type opcode: int
-        :return: This method does not return a value as its execution modifies the
-            state of various internal components, like registers, program counter,
-            or stack.
-        :rtype: None
-        """
-        # extract the opcode parts
-        nnn = opcode & 0x0FFF
-        n = opcode & 0x000F
-        x = (opcode & 0x0F00) >> 8
-        y = (opcode & 0x00F0) >> 4
-
-        # a match statement to handle the extended opcodes
-        match opcode & 0xF000:
-            case 0x1000:
-                # jump to address nnn
-                self._register.set_pc(nnn)
-            case 0x1000:
-                # jump to address nnn
-                self._register.set_pc(nnn)
-
-            case 0x2000:
-                # call subroutine at nnn
-                self._stack.push(self._register.get_pc())
-                self._register.set_pc(nnn)
-
-            case 0x3000:
-                # skip next instruction if Vx == nn
-                if self._register.get_v(x) == (opcode & 0x00FF):
-                    self._register.increment_pc()
-            case 0x4000:
-                # skip next instruction if Vx != nn
-                if self._register.get_v(x) != (opcode & 0x00FF):
-                    self._register.increment_pc()
-            case 0x5000:
-                # skip next instruction if Vx == Vy
-                if self._register.get_v(x) == self._register.get_v(y):
-                    self._register.increment_pc()
-            case 0x6000:
-                # set Vx to nn
-                self._register.set_v(x, opcode & 0x00FF)
-            case 0x7000:
-                # add nn to Vx
-                self._register.set_v(x, (self._register.get_v(x) + (opcode & 0x00FF)) & 0xFF)
-            case 0x8000:
-                # execute extended 8 opcodes
-                self._execute_extended_8(opcode)
-            case 0x9000:
-                # skip next instruction if Vx != Vy
-                if self._register.get_v(x) != self._register.get_v(y):
-                    self._register.increment_pc()
-            case 0xA000:
-                # set I to nnn
-                self._register.set_i(nnn)
-            case 0xB000:
-                # jump to address nnn + V0
-                self._register.set_pc(nnn + self._register.get_v(0))
-            case 0xC000:
-                # set Vx to random number AND nn
-                self._register.set_v(x, random.randint(0, 255) & (opcode & 0x00FF))
-            case 0xD000:
-                # draw a sprite at position Vx, Vy with n bytes of sprite data
-                self._screen.draw_sprite(self._register.get_v(x), self._register.get_v(y),
-                                         self._memory.get_memory_range(self._register.get_i(), n))
-            case 0xE000:
-                # execute extended E opcodes
-                self._execute_extended_e(opcode)
-            case 0xF000:
-                # execute extended F opcodes
-                self._execute_extended_f(opcode)
-            case _:
-                # ignore invalid opcodes
-                pass
-
-    def _execute_extended_8(self, opcode: int) -> None:
-        """
-        Handles the execution of extended opcodes in the 0x8XY_ category. This method decodes
-        the given opcode, extracts its components, and performs the operation based on the
-        instruction type specified in the least significant nibble of the opcode. Operations
-        executed by this method include logical operations (OR, AND, XOR), register
-        assignments, and arithmetic operations with optional flag adjustments in the VF
-        register.
-
-        :param opcode: The 16-bit opcode to be executed. Encodes the operation to perform and
-                       the registers it operates on.
-        :type opcode: int
-        :return: None
-        :rtype: None
-        """
-        # extract the opcode parts
-        n = opcode & 0x000F
-        x = (opcode & 0x0F00) >> 8
-        y = (opcode & 0x00F0) >> 4
-
-        # a match statement to handle the extended 8 opcodes
-        match n:
-            case 0x0000:
-                # set Vx to Vy
-                self._register.set_v(x, self._register.get_v(y))
-            case 0x0001:
-                # set Vx to Vx OR Vy
-                self._register.set_v(x, self._register.get_v(x) | self._register.get_v(y))
-            case 0x0002:
-                # set Vx to Vx AND Vy
-                self._register.set_v(x, self._register.get_v(x) & self._register.get_v(y))
-            case 0x0003:
-                # set Vx to Vx XOR Vy
-                self._register.set_v(x, self._register.get_v(x) ^ self._register.get_v(y))
-            case 0x0004:
-                # add Vy to Vx, set VF to carry
-                result = self._register.get_v(x) + self._register.get_v(y)
-                self._register.set_v(x, result & 0xFF)
-                self._register.set_v(0xF, 1 if result > 0xFF else 0)
-            case 0x0005:
-                # subtract Vy from Vx, set VF to NOT borrow
-                self._register.set_v(0xF, 1 if self._register.get_v(x) > self._register.get_v(y) else 0)
-                self._register.set_v(x, (self._register.get_v(x) - self._register.get_v(y)) & 0xFF)
-            case 0x0006:
-                # shift Vx right by 1, set VF to LSB of Vx
-                self._register.set_v(0xF, self._register.get_v(x) & 0x1)
-                self._register.set_v(x, self._register.get_v(x) >> 1)
-            case 0x0007:
-                # set Vx to Vy - Vx, set VF to NOT borrow
-                self._register.set_v(0xF, 1 if self._register.get_v(y) > self._register.get_v(x) else 0)
-                self._register.set_v(x, (self._register.get_v(y) - self._register.get_v(x)) & 0xFF)
-            case 0x000E:
-                # shift Vx left by 1, set VF to MSB of Vx
-                self._register.set_v(0xF, (self._register.get_v(x) & 0x80) >> 7)
-                self._register.set_v(x, (self._register.get_v(x) << 1) & 0xFF)
-            case _:
-                # ignore invalid opcodes
-                pass
-
-    def _execute_extended_e(self, opcode: int) -> None:
-        """
-        Handles the execution of extended opcodes in the 0xEX__ category. This method decodes
-        the given opcode, extracts its components, and performs the operation based on the
-        instruction type specified in the least significant byte of the opcode. Operations
-        executed by this method include key press checks and conditional skips based on key
-        states.
-
-        :param opcode: The 16-bit opcode to be executed. Encodes the operation to perform and
-                       the registers it operates on.
-        :type opcode: int
-        :return: None
-        :rtype: None
-        """
-        # extract the opcode parts
-        x = (opcode & 0x0F00) >> 8
-
-        # a match statement to handle the extended E opcodes
-        match opcode & 0x00FF:
-            case 0x009E:
-                # skip next instruction if key in Vx is pressed
-                if self._keyboard.is_key_down(self._register.get_v(x)):
-                    self._register.increment_pc()
-
-            case 0x00A1:
-                # skip next instruction if key in Vx is not pressed
-                if not self._keyboard.is_key_down(self._register.get_v(x)):
-                    self._register.increment_pc()
-            case _:
-                # ignore invalid opcodes
-                pass
-
-    def _execute_extended_f(self, opcode: int) -> None:
+        for _ in range(cycles):
+            # fetch the decoded instruction, decoding it on a cache miss
+            pc = register.pc
+            entry = decoded[pc]
+            if entry is None:
+                entry = decoded[pc] = self._decode(self._read_short(pc))
+
+            # increment the programm counter
+            register.pc = (pc + 2) & 0xFFF
+
+            # excute the instruction
+            entry()
+
+    def _play_sound(self):
+        pass
+
+    def _decode(self, opcode: int) -> Callable[[], None]:
         """
-        Handles the execution of extended opcodes in the 0xFX__ category. This method decodes
-        the given opcode, extracts its components, and performs the operation based on the
-        instruction type specified in the least significant byte of the opcode. Operations
-        executed by this method include setting register values based on key states, updating
-        the delay timer, and waiting for key presses.
-
-        :param opcode: The 16-bit opcode to be executed. Encodes the operation to perform and
-                       the registers it operates on.
+        Decodes the given opcode into an entry of the decoded-instruction cache.
+
+        The entry is a callable without arguments executing the instruction, with
+        the operands pre-extracted from the opcode bound into it, so executing a
+        cached instruction requires no bit masking and only the fields a handler
+        uses are extracted. The builder of the instruction is looked up in the
+        primary dispatch table by the highest nibble of the opcode, and in the
+        sub-table of the group for the 0x0, 0x8, 0xE and 0xF opcodes. The most
+        frequent opcodes are built into specialized closures, all other handlers are
+        bound to their operands with `functools.partial`. Invalid opcodes decode to a
+        handler that does nothing.
+
+        :param opcode: The 16-bit opcode to be decoded.
         :type opcode: int
-        :return: None
-        :rtype: None
+        :return: The instruction as a callable without arguments.
+        :rtype: Callable[[], None]
         """
-        # extract the opcode parts
-        x = (opcode & 0x0F00) >> 8
-
-        # a match statement to handle the extended F opcodes
-        match opcode & 0x00FF:
-            case 0x0007:
-                # set Vx to delay timer value
-                self._register.set_v(x, self._register.get_dt())
-            case 0x000A:
-                # wait for key press, store key in Vx
-                self._register.set_v(x, self._keyboard.is_key_down(int(self._register.get_v(x))))
-            case 0x0015:
-                # set delay timer to Vx
-                self._register.set_dt(self._register.get_v(x))
-            case 0x0018:
-                # set sound timer to Vx
-                self._register.set_st(self._register.get_v(x))
-            case 0x001E:
-                # add Vx to I
-                self._register.set_i((self._register.get_i() + self._register.get_v(x)) & 0xFFFF)
-            case 0x0029:
-                # set I to the location of the sprite for the character in Vx
-                self._register.set_i(self._register.get_v(x) * 5)
-            case 0x0033:
-                # store BCD representation of Vx in memory locations I, I+1, I+2
-                value = self._register.get_v(x)
-                self._memory.set_memory(self._register.get_i(), value // 100)
-                self._memory.set_memory(self._register.get_i() + 1, (value // 10) % 10)
-                self._memory.set_memory(self._register.get_i() + 2, value % 10)
-            case 0x0055:
-                # store registers V0 through Vx in memory starting at location I
-                for i in range(x + 1):
-                    self._memory.set_memory(self._register.get_i() + i, self._register.get_v(i))
-            case 0x0065:
-                # read registers V0 through Vx from memory starting at location I
-                for i in range(x + 1):
-                    self._register.set_v(i, self._memory.get_memory(self._register.get_i() + i))
-            case _:
-                # ignore invalid opcodes
-                pass
+        # select the builder by the highest nibble, grouped opcodes are resolved by a sub-table
+        spec = self._primary[opcode >> 12]
+        if spec is None:
+            table, mask = self._secondary[opcode >> 12]
+            spec = table.get(opcode & mask, (_bind(self._op_nop), _no_operands))
+
+        build, operands = spec
+        return build(*operands(opcode))
+
+    def _make_00ee(self) -> Callable[[], None]:
+        """Build the instruction returning from a subroutine."""
+        register = self._register
+        pop = self._stack.pop
+
+        def op_00ee() -> None:
+            register.pc = pop()
+        return op_00ee
+
+    def _make_1nnn(self, nnn: int) -> Callable[[], None]:
+        """Build the instruction jumping to address nnn."""
+        register = self._register
+
+        def op_1nnn() -> None:
+            register.pc = nnn
+        return op_1nnn
+
+    def _make_2nnn(self, nnn: int) -> Callable[[], None]:
+        """Build the instruction calling the subroutine at nnn."""
+        register = self._register
+        push = self._stack.push
+
+        def op_2nnn() -> None:
+            push(register.pc)
+            register.pc = nnn
+        return op_2nnn
+
+    def _make_3xkk(self, x: int, kk: int) -> Callable[[], None]:
+        """Build the instruction skipping the next instruction if Vx == kk."""
+        v = self._v
+        register = self._register
+
+        def op_3xkk() -> None:
+            if v[x] == kk:
+                register.pc = (register.pc + 2) & 0xFFF
+        return op_3xkk
+
+    def _make_4xkk(self, x: int, kk: int) -> Callable[[], None]:
+        """Build the instruction skipping the next instruction if Vx != kk."""
+        v = self._v
+        register = self._register
+
+        def op_4xkk() -> None:
+            if v[x] != kk:
+                register.pc = (register.pc + 2) & 0xFFF
+        return op_4xkk
+
+    def _make_6xkk(self, x: int, kk: int) -> Callable[[], None]:
+        """Build the instruction setting Vx to kk."""
+        v = self._v
+
+        def op_6xkk() -> None:
+            v[x] = kk
+        return op_6xkk
+
+    def _make_7xkk(self, x: int, kk: int) -> Callable[[], None]:
+        """Build the instruction adding kk to Vx."""
+        v = self._v
+
+        def op_7xkk() -> None:
+            v[x] = (v[x] + kk) & 0xFF
+        return op_7xkk
+
+    def _make_8xy0(self, x: int, y: int) -> Callable[[], None]:
+        """Build the instruction setting Vx to Vy."""
+        v = self._v
+
+        def op_8xy0() -> None:
+            v[x] = v[y]
+        return op_8xy0
+
+    def _make_8xy4(self, x: int, y: int) -> Callable[[], None]:
+        """Build the instruction adding Vy to Vx, setting VF to carry."""
+        v = self._v
+
+        def op_8xy4() -> None:
+            result = v[x] + v[y]
+            v[x] = result & 0xFF
+            v[0xF] = result >> 8
+        return op_8xy4
+
+    def _make_annn(self, nnn: int) -> Callable[[], None]:
+        """Build the instruction setting I to nnn."""
+        register = self._register
+
+        def op_annn() -> None:
+            register.i = nnn
+        return op_annn
+
+    def _make_dxyn(self, x: int, y: int, n: int) -> Callable[[], None]:
+        """Build the instruction drawing a sprite at position Vx, Vy with n bytes of sprite data."""
+        v = self._v
+        register = self._register
+        draw_sprite = self._screen.draw_sprite
+        get_memory_range = self._memory.get_memory_range
+
+        def op_dxyn() -> None:
+            v[0xF] = draw_sprite(v[x], v[y], get_memory_range(register.i, n))
+        return op_dxyn
+
+    def _make_ex9e(self, x: int) -> Callable[[], None]:
+        """Build the instruction skipping the next instruction if the key in Vx is pressed."""
+        v = self._v
+        register = self._register
+        is_key_down = self._keyboard.is_key_down
+
+        def op_ex9e() -> None:
+            if is_key_down(v[x]):
+                register.pc = (register.pc + 2) & 0xFFF
+        return op_ex9e
+
+    def _make_exa1(self, x: int) -> Callable[[], None]:
+        """Build the instruction skipping the next instruction if the key in Vx is not pressed."""
+        v = self._v
+        register = self._register
+        is_key_down = self._keyboard.is_key_down
+
+        def op_exa1() -> None:
+            if not is_key_down(v[x]):
+                register.pc = (register.pc + 2) & 0xFFF
+        return op_exa1
+
+    def _op_nop(self) -> None:
+        """Ignore an invalid opcode."""
+
+    def _op_00e0(self) -> None:
+        """Clear the screen."""
+        self._screen.clear_screen_array()
+
+    def _op_5xy0(self, x: int, y: int) -> None:
+        """Skip the next instruction if Vx == Vy."""
+        if self._v[x] == self._v[y]:
+            self._register.pc = (self._register.pc + 2) & 0xFFF
+
+    def _op_8xy1(self, x: int, y: int) -> None:
+        """Set Vx to Vx OR Vy."""
+        self._v[x] |= self._v[y]
+
+    def _op_8xy2(self, x: int, y: int) -> None:
+        """Set Vx to Vx AND Vy."""
+        self._v[x] &= self._v[y]
+
+    def _op_8xy3(self, x: int, y: int) -> None:
+        """Set Vx to Vx XOR Vy."""
+        self._v[x] ^= self._v[y]
+
+    def _op_8xy5(self, x: int, y: int) -> None:
+        """Subtract Vy from Vx, set VF to NOT borrow."""
+        v = self._v
+        vx = v[x]
+        vy = v[y]
+        v[x] = (vx - vy) & 0xFF
+        v[0xF] = vx >= vy
+
+    def _op_8xy6(self, x: int) -> None:
+        """Shift Vx right by 1, set VF to the LSB of Vx."""
+        v = self._v
+        vx = v[x]
+        v[x] = vx >> 1
+        v[0xF] = vx & 0x1
+
+    def _op_8xy7(self, x: int, y: int) -> None:
+        """Set Vx to Vy - Vx, set VF to NOT borrow."""
+        v = self._v
+        vx = v[x]
+        vy = v[y]
+        v[x] = (vy - vx) & 0xFF
+        v[0xF] = vy >= vx
+
+    def _op_8xye(self, x: int) -> None:
+        """Shift Vx left by 1, set VF to the MSB of Vx."""
+        v = self._v
+        vx = v[x]
+        v[x] = (vx << 1) & 0xFF
+        v[0xF] = vx >> 7
+
+    def _op_9xy0(self, x: int, y: int) -> None:
+        """Skip the next instruction if Vx != Vy."""
+        if self._v[x] != self._v[y]:
+            self._register.pc = (self._register.pc + 2) & 0xFFF
+
+    def _op_bnnn(self, nnn: int) -> None:
+        """Jump to address nnn + V0."""
+        self._register.pc = (nnn + self._v[0]) & 0xFFF
+
+    def _op_cxkk(self, x: int, kk: int) -> None:
+        """Set Vx to a random number AND kk."""
+        self._v[x] = self._rand_get(8) & kk
+
+    def _op_fx07(self, x: int) -> None:
+        """Set Vx to the delay timer value."""
+        self._v[x] = self._register.dt
+
+    def _op_fx0a(self, x: int) -> None:
+        """Wait for a key press, store the key in Vx."""
+        keyboard = self._keyboard
+        if not self._waiting_key:
+            # only a key pressed after the wait started is accepted
+            keyboard.last_pressed = None
+            self._waiting_key = True
+
+        key = keyboard.last_pressed
+        if key is None:
+            # execute this instruction again until a key is pressed
+            self._register.pc = (self._register.pc - 2) & 0xFFF
+        else:
+            self._v[x] = key
+            keyboard.last_pressed = None
+            self._waiting_key = False
+
+    def _op_fx15(self, x: int) -> None:
+        """Set the delay timer to Vx."""
+        self._register.dt = self._v[x]
+
+    def _op_fx18(self, x: int) -> None:
+        """Set the sound timer to Vx."""
+        self._register.st = self._v[x]
+
+    def _op_fx1e(self, x: int) -> None:
+        """Add Vx to I."""
+        self._register.i = (self._register.i + self._v[x]) & 0xFFF
+
+    def _op_fx29(self, x: int) -> None:
+        """Set I to the location of the sprite for the character in Vx."""
+        self._register.i = self._v[x] * 5
+
+    def _op_fx33(self, x: int) -> None:
+        """Store the BCD representation of Vx in memory locations I, I+1, I+2."""
+        address = self._register.i
+        # a slice past the end would resize the memory instead of failing
+        if address + 3 > 4096:
+            raise ValueError("Address must be between 0 and 4095")
+        self._mem[address:address + 3] = _BCD[self._v[x]]
+        self._memory.invalidate(address, 3)
+
+    def _op_fx55(self, x: int) -> None:
+        """Store registers V0 through Vx in memory starting at location I."""
+        address = self._register.i
+        end = address + x + 1
+        # a slice past the end would resize the memory instead of failing
+        if end > 4096:
+            raise ValueError("Address must be between 0 and 4095")
+        self._mem[address:end] = self._v[:x + 1]
+        self._memory.invalidate(address, x + 1)
+
+    def _op_fx65(self, x: int) -> None:
+        """Read registers V0 through Vx from memory starting at location I."""
+        address = self._register.i
+        end = address + x + 1
+        # a slice past the end would resize the registers instead of failing
+        if end > 4096:
+            raise ValueError("Address must be between 0 and 4095")
+        self._v[:x + 1] = self._mem[address:end]
 
 
 if __name__ == "__main__":
@@ -1,20 +1,31 @@
 import tkinter as tk
 
+# maps the key symbols of the host keyboard to the Chip-8 keys
+KEY_MAPPING = {
+    "0": 0, "1": 1, "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9, "a": 10, "b": 11, "c": 12, "d": 13, "e": 14, "f": 15
+}
+
 
 class Keyboard:
     """
     Represents a Keyboard class for managing key states.
 
     This class is used to manage and track the state of keyboard keys. It enables
-    checking whether specific keys are pressed ("down") or released ("up") and allows
-    modification of those states based on key events. The implementation uses an
-    internal dictionary to keep track of the current state of keys, where each key is
-    mapped to a boolean value indicating whether it is active (pressed) or inactive
-    (released).
-
-    :ivar _keys: Dictionary for tracking the state of keys.
-    :type _keys: dict
+    checking whether specific keys are pressed ("down") and allows modification of
+    those states based on key events. The implementation uses an internal bytearray
+    indexed by the Chip-8 key (0 to 15) to keep track of the current state of keys,
+    where 1 means the key is active (pressed) and 0 inactive (released).
+
+    :ivar _keys: Bytearray for tracking the state of the 16 keys.
+    :type _keys: bytearray
+    :ivar last_pressed: The most recently pressed key not yet consumed by a
+        wait-for-key instruction, or None. A wait-for-key instruction clears it when it
+        starts waiting, so only a key pressed during the wait is accepted.
+    :type last_pressed: int | None
     """
+
+    __slots__ = ("_keys", "last_pressed")
+
     def __init__(self):
         """
         Represents an initializer for internal keys setting up.
@@ -24,27 +35,12 @@ class Keyboard:
         the object is instantiated.
 
         Attributes:
-            _keys (Any): Represents the internal keys initialized by `_set_keys`.
+            _keys (bytearray): Represents the internal keys initialized by `_set_keys`.
+            last_pressed (int | None): The most recently pressed key, None until a key
+                is pressed or after it has been consumed.
         """
         self._keys = self._set_keys()
-
-        # a dict with the key mapping
-        self._key_mapping = {
-            "0": 0, "1": 1, "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9, "a": 10, "b": 11, "c": 12, "d": 13, "e": 14, "f": 15
-        }
-
-    def is_key_up(self, key: str) -> bool:
-        """
-        Determines if a specific key is in the "up" or released state. A key is considered
-        "up" if it is not currently active or pressed. Useful for input management in
-        applications that rely on key states.
-
-        :param key: The key for which the state is being checked.
-        :type key: str
-        :return: True if the specified key is in the "up" state, False otherwise.
-        :rtype: bool
-        """
-        return not (self._keys[key])
+        self.last_pressed = None
 
     def is_key_down(self, key: int) -> bool:
         """
@@ -54,75 +50,58 @@ class Keyboard:
         pressed and returns a boolean value indicative of its state. It uses
         the internal `_keys` attribute to determine the key's current state.
 
-        :param key: The key to be checked.
-        :type key: str
+        :param key: The Chip-8 key (0 to 15) to be checked.
+        :type key: int
         :return: True if the given key is pressed, False otherwise.
         :rtype: bool
         """
-        return self._keys[key]
+        return bool(self._keys[key])
 
-    def key_down(self, key: str) -> None:
+    def key_down(self, key: int) -> None:
         """
-        Tracks a key press event by updating the internal state to mark the key as pressed.
+        Tracks a key press event by updating the internal state to mark the key as pressed
+        and remembering it as the most recently pressed key.
 
-        :param key: The key that was pressed.
-        :type key: str
+        :param key: The Chip-8 key (0 to 15) that was pressed.
+        :type key: int
         :return: None
         """
-        self._keys[key] = True
+        self._keys[key] = 1
+        self.last_pressed = key
 
-    def key_up(self, key: str) -> None:
+    def key_up(self, key: int) -> None:
         """
         Handles the release of a specific key by marking it as unpressed in the internal
-        key tracking dictionary.
+        key tracking bytearray.
 
-        This method modifies the internal `_keys` dictionary of the instance by setting
-        the provided key's value to `False`, indicating that the key is no longer being
-        pressed. It assumes the key is represented as a string and exists in the `_keys`
-        dictionary.
+        This method modifies the internal `_keys` bytearray of the instance by setting
+        the provided key's value to 0, indicating that the key is no longer being
+        pressed.
 
-        :param key: The string representing the key to be updated in the keys tracking
-            dictionary.
-        :type key: str
+        :param key: The Chip-8 key (0 to 15) to be updated in the keys tracking
+            bytearray.
+        :type key: int
         :return: None
         """
-        self._keys[key] = False
+        self._keys[key] = 0
 
-    def _set_keys(self) -> dict:
+    def _set_keys(self) -> bytearray:
         """
-        Generates and returns a dictionary mapping specific keys to their initial
-        boolean values of False. The function is primarily intended to provide a
-        default setup for a key-value structure, where each key corresponds to
-        a character representation from '0' to '9' and 'a' to 'f'. The values are
-        set to False, representing a preliminary inactive or unchecked state.
-
-        :return: A dictionary where character keys ('0'-'9', 'a'-'f') are
-            mapped to boolean values indicating their initial inactive state.
-        :rtype: dict
+        Generates and returns a bytearray holding the state of the 16 Chip-8 keys,
+        indexed by the key (0 to 15). All keys are set to 0, representing their
+        initial released state.
+
+        :return: A bytearray of 16 zero bytes indicating the initial released state
+            of every key.
+        :rtype: bytearray
         """
-        return {
-            0: False
-            , 1: False
-            , 2: False
-            , 3: False
-            , 4: False
-            , 5: False
-            , 6: False
-            , 7: False
-            , 8: False
-            , 9: False
-            , 10: False
-            , 11: False
-            , 12: False
-            , 13: False
-            , 14: False
-            , 15: False
-        }
+        return bytearray(16)
 
     def key_event(self, event):
         """
         Handles key events for both key press and key release actions. This method listens
-        for key events and updates the internal state of keys accordingly.
+        for key events and updates the internal state of keys accordingly, remembering a
+        pressed key as the most recently pressed one.
 
         :param event: An event object that contains details about the type of event
             (KeyPress or KeyRelease) and the key symbol being pressed or released.
@@ -130,8 +109,8 @@ class Keyboard:
         :return: None
         """
         if event.type == '2':
-            if event.keysym in self._key_mapping:
-                self._keys[self._key_mapping[event.keysym]] = True
+            if event.keysym in KEY_MAPPING:
+                self.key_down(KEY_MAPPING[event.keysym])
         elif event.type == '3':
-            if event.keysym in self._key_mapping:
-                self._keys[self._key_mapping[event.keysym]] = False
+            if event.keysym in KEY_MAPPING:
+                self.key_up(KEY_MAPPING[event.keysym])
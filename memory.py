@@ -1,5 +1,7 @@
 class Memory:
-    def __init__(self) -> None:
+    __slots__ = ("mem", "_decoded")
+
+    def __init__(self, decoded: list | None = None) -> None:
         """
         Represents a memory manager for managing a byte-addressable memory space.
 
@@ -8,40 +10,46 @@ class Memory:
         a bytearray that can be referenced or manipulated during the program execution.
 
         Attributes:
-            _memory (bytearray): A bytearray object initialized to a size of 4096 bytes,
-                                 representing the memory space.
+            mem (bytearray): A bytearray object initialized to a size of 4096 bytes,
+                             representing the memory space. It is public so the CPU can
+                             index it directly; direct writes must be followed by a call
+                             to `invalidate`.
+            _decoded (list): An optional decoded-instruction cache indexed by address. Writes
+                             to the memory clear the entries overlapping the written bytes.
         """
         # Initialize the memory
-        self._memory = bytearray(4096)
+        self.mem = bytearray(4096)
+
+        # the decoded-instruction cache to invalidate on writes
+        self._decoded = decoded
 
     def get_memory(self, address: int) -> int:
         """
         Retrieves the value from a memory address in the memory array.
 
         This function accesses an internal memory structure based on the provided
-        address. It validates that the address falls within the acceptable range.
-        If the address is invalid, a ValueError is raised. The function returns
-        the integer value stored at the specified address.
+        address. It asserts that the address falls within the acceptable range; the
+        assertion is stripped when Python runs with -O. The function returns the
+        integer value stored at the specified address.
 
         :param address: The memory address to retrieve the value from. Must be
             an integer within the range 0 to 4095.
         :type address: int
         :return: The value stored at the specified memory address.
         :rtype: int
-        :raises ValueError: If the address is not within the allowed range (0-4095).
+        :raises AssertionError: If the address is not within the allowed range (0-4095).
         """
 
         # check if address is between 0 and 4095
-        if address < 0 or address > 4095:
-            raise ValueError("Address must be between 0 and 4095")
-        return self._memory[address]
+        assert 0 <= address <= 4095, "Address must be between 0 and 4095"
+        return self.mem[address]
 
     def set_memory(self, address: int, value: int) -> None:
         """
         Sets a value at a specified memory address in the memory object. This method
-        checks if the provided address and value are within their respective valid
-        ranges. The valid range for the address is 0 to 4095, and for the value, it is
-        0 to 255. If the values are out of bounds, a ValueError is raised.
+        asserts that the provided address and value are within their respective valid
+        ranges; the assertions are stripped when Python runs with -O. The valid range
+        for the address is 0 to 4095, and for the value, it is 0 to 255.
 
         :param address: Memory address to set the value. Must be between 0 and 4095.
         :type address: int
@@ -49,66 +57,101 @@ class Memory:
             0 and 255.
         :type value: int
 
-        :raises ValueError: If the address is not in the range between 0 and 4095 or
+        :raises AssertionError: If the address is not in the range between 0 and 4095 or
             if the value is not in the range between 0 and 255.
 
         :return: None
         """
 
-        # check if address is between 0 and 4095
-        if address < 0 or address > 4095:
-            raise ValueError("Address must be between 0 and 4095")
-
-        # check if value is between 0 and 255
-        if value < 0 or value > 255:
-            raise ValueError("Value must be between 0 and 255")
+        # check if address is between 0 and 4095 and value is between 0 and 255
+        assert 0 <= address <= 4095, "Address must be between 0 and 4095"
+        assert 0 <= value <= 255, "Value must be between 0 and 255"
 
         # set the value of the memory address
-        self._memory[address] = value
+        self.mem[address] = value
+
+        # invalidate the decoded instructions containing the address
+        self.invalidate(address, 1)
 
-    def get_memory_range(self, start: int, end: int) -> bytearray:
+    def get_memory_range(self, start: int, length: int) -> memoryview:
         """
         Retrieves a specific range of memory from the internal memory buffer.
 
-        This method allows access to a range of memory addresses within a defined
-        memory buffer. The method ensures that the start and end addresses are valid
-        and within a permissible range. The range must also be specified correctly,
-        with the start address being less than or equal to the end address. If the
-        conditions are not met, a `ValueError` is raised.
+        This method allows access to `length` bytes of memory starting at the address
+        `start`. The range is returned as a `memoryview` of the memory, so
+        no bytes are copied; the view reflects later writes to the memory. The method
+        ensures that the range lies within the memory, otherwise a `ValueError` is
+        raised.
 
         :param start: The starting address of the memory range. Must be an integer
             between 0 and 4095 (inclusive).
-        :param end: The ending address of the memory range. Must be an integer
-            between 0 and 4095 (inclusive).
-        :return: A `bytearray` containing the memory values from the specified
-            range.
-        :rtype: bytearray
-
-        :raises ValueError: If `start` or `end` is outside the valid range of 0 to 4095.
-        :raises ValueError: If `start` is greater than `end`.
+        :type start: int
+        :param length: The number of bytes in the memory range. The range must end
+            at or before the end of the memory.
+        :type length: int
+        :return: A `memoryview` of the memory values in the specified range.
+        :rtype: memoryview
+
+        :raises ValueError: If `start` is outside the valid range of 0 to 4095.
+        :raises ValueError: If the range does not fit into the memory.
         """
 
-        # check if start and end are between 0 and 4095
+        # check if start is between 0 and 4095 and the range ends within the memory
         if start < 0 or start > 4095:
             raise ValueError("Start address must be between 0 and 4095")
-        if end < 0 or end > 4095:
-            raise ValueError("End address must be between 0 and 4095")
+        if length < 0 or start + length > 4096:
+            raise ValueError("Memory range must end at or before address 4096")
 
-        return self._memory[start:start + end]
+        return memoryview(self.mem)[start:start + length]
 
-    def set_memory_range(self, start: int, data: bytearray) -> None:
+    def set_memory_range(self, start: int, data: bytes) -> None:
         """
         Updates a specific range of bytes in the memory starting from the
         given address with the provided data.
 
         This method modifies the internal memory by replacing a portion of it
-        with the provided data, starting from the specified memory address.
+        with the provided data, starting from the specified memory address. The
+        data is accessed through a `memoryview`, so any bytes-like object is
+        copied into the memory without an intermediate copy. The range is checked
+        once to fit into the memory.
 
         :param start: The starting address in memory where data should be written.
         :type start: int
-        :param data: The data as a sequence of bytes which will overwrite the
+        :param data: The data as a bytes-like object which will overwrite the
             memory range.
-        :type data: bytearray
+        :type data: bytes
+        :raises ValueError: If the data does not fit into the memory at `start`.
+        :return: None
+        """
+        view = memoryview(data)
+        end = start + len(view)
+
+        # a slice past the end would resize the memory instead of failing
+        if start < 0 or end > 4096:
+            raise ValueError("Memory range must end at or before address 4096")
+        self.mem[start:end] = view
+
+        # invalidate the decoded instructions overlapping the range
+        self.invalidate(start, len(view))
+
+    def invalidate(self, start: int, length: int) -> None:
+        """
+        Clears the decoded instructions overlapping a range of written bytes.
+
+        An instruction is two bytes long, so besides the instructions starting inside
+        the range the one starting at the byte before the range is cleared as well;
+        before address 0 that is the instruction wrapping around from address 4095.
+        Does nothing if the memory has no decoded-instruction cache.
+
+        :param start: The address of the first written byte.
+        :type start: int
+        :param length: The number of written bytes.
+        :type length: int
         :return: None
         """
-        self._memory[start:start + len(data)] = data
+        if self._decoded is not None:
+            low = max(start - 1, 0)
+            high = min(start + length, len(self._decoded))
+            self._decoded[low:high] = [None] * (high - low)
+            if start == 0:
+                self._decoded[-1] = None
@@ -1,3 +1,6 @@
+import mmap
+
+
 class RomLoader:
     def __init__(self, rom: str):
         """
@@ -12,27 +15,34 @@ class RomLoader:
         self.rom = rom
         self._data = self._read_rom()
 
-    def _read_rom(self) -> bytearray:
+    def _read_rom(self) -> mmap.mmap | bytes:
         """
-        Reads the ROM file specified by the `rom` attribute in binary mode and
-        returns its contents as a bytearray. This method is intended for internal
-        use only.
+        Maps the ROM file specified by the `rom` attribute read-only into memory
+        instead of reading it into a buffer, so the contents are not copied. The
+        mapping supports `len()`, indexing, slicing and the buffer protocol like
+        bytes. An empty file cannot be mapped and is returned as empty bytes.
+        This method is intended for internal use only.
 
-        :return: The contents of the ROM file as a bytearray.
-        :rtype: bytearray
+        :return: A read-only mapping of the ROM file, or empty bytes for an empty file.
+        :rtype: mmap.mmap | bytes
         """
         with open(self.rom, "rb") as f:
-            return bytearray(f.read())
+            # mapping a file of length 0 fails
+            if f.seek(0, 2) == 0:
+                return b""
+
+            # the mapping stays valid after the file is closed
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
-    def get_rom_data(self) -> bytearray:
+    def get_rom_data(self) -> mmap.mmap | bytes:
         """
-        Retrieves the data stored in the ROM as a bytearray.
+        Retrieves the data stored in the ROM as a read-only bytes-like object.
 
         This method provides access to the internal storage of ROM data and
-        returns it as a bytearray. The data represents the content currently
-        stored in the ROM.
+        returns it as a read-only mapping of the ROM file. The data represents
+        the content currently stored in the ROM.
 
-        :return: The data stored in the ROM as a bytearray
-        :rtype: bytearray
+        :return: The data stored in the ROM as a read-only bytes-like object
+        :rtype: mmap.mmap | bytes
         """
         return self._data
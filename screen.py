@@ -1,19 +1,69 @@
 import tkinter
+from typing import Callable
 from keyboard import Keyboard
 
+# the colors of an unset and a set pixel
+PIXEL_COLORS = ("#000000", "#ffffff")
+
+# translates the binary digits of a row into a Tcl list of pixel colors
+_ROW_COLORS = str.maketrans({"0": PIXEL_COLORS[0] + " ", "1": PIXEL_COLORS[1] + " "})
+
+
+def _draw_sprite(rows: list, width: int, height: int, x: int, y: int, sprite: memoryview) -> bool:
+    """
+    XORs a sprite into a row bitmap and reports whether a set pixel was erased.
+
+    Every row of the screen is a single integer with the leftmost pixel in the most
+    significant of its `width` bits. A sprite byte is rotated into place within the row,
+    which wraps it around the right edge, and XORed into the row in one operation; rows
+    wrap around the bottom edge. All state is passed in as arguments and the shifts are
+    computed before the loop, so the loop only touches local variables. The collisions
+    of all rows are accumulated without a branch.
+
+    :param rows: The rows of the screen, one integer bitmap per row.
+    :type rows: list
+    :param width: The width of the screen in pixels, a power of two.
+    :type width: int
+    :param height: The height of the screen in pixels, a power of two.
+    :type height: int
+    :param x: The x-coordinate of the top left corner of the sprite.
+    :type x: int
+    :param y: The y-coordinate of the top left corner of the sprite.
+    :type y: int
+    :param sprite: The sprite data, one byte per 8-pixel row.
+    :type sprite: memoryview
+    :return: True if any previously set pixel was erased, False otherwise.
+    :rtype: bool
+    """
+    mask = (1 << width) - 1
+    shift = width - 8
+    hmask = height - 1
+    x &= width - 1
+    rotate = width - x
+    collision = 0
+    for j, byte in enumerate(sprite):
+        # rotate the byte right by x from the left edge of the row
+        bits = byte << shift
+        bits = ((bits >> x) | (bits << rotate)) & mask
+        row = (y + j) & hmask
+        old = rows[row]
+        rows[row] = old ^ bits
+        collision |= old & bits
+    return collision != 0
+
 
 class Screen(tkinter.Canvas):
     def __init__(self, title: str, width: int, height: int, screen_multiplier: int, keyboard: Keyboard):
         """
         Represents a graphical window for rendering a screen with pixel-based drawing
         and responding to keyboard events. It uses tkinter for graphical rendering
-        and manages pixel data in a byte array format.
+        and manages pixel data as one integer bitmap per row.
 
         :param title: The title of the tkinter window.
         :type title: str
-        :param width: Number of pixels in the horizontal dimension of the screen.
+        :param width: Number of pixels in the horizontal dimension of the screen, a power of two.
         :type width: int
-        :param height: Number of pixels in the vertical dimension of the screen.
+        :param height: Number of pixels in the vertical dimension of the screen, a power of two.
         :type height: int
         :param screen_multiplier: Factor by which each logical pixel is scaled
             for rendering to the screen, defining the size of each pixel visually.
@@ -22,6 +72,10 @@ class Screen(tkinter.Canvas):
         :type keyboard: Keyboard
         """
 
+        # the coordinates wrap around the edges by masking, which needs powers of two
+        assert width & (width - 1) == 0 and height & (height - 1) == 0, \
+            "Width and height must be powers of two"
+
         # create a tkinter window
         master = tkinter.Tk()
         master.title(title)
@@ -43,10 +97,18 @@ class Screen(tkinter.Canvas):
         self._width = width
         self._height = height
         self._screen_multiplier = screen_multiplier
-        self._pixel_size = screen_multiplier
 
-        # represent screen as Byte array
-        self._pixel = bytearray(width * height)
+        # represent every row of the screen as an integer bitmap, leftmost pixel first
+        self._rows = [0] * height
+
+        # set when the rows changed since the last rendered frame
+        self._dirty = True
+
+        # the framebuffer is put into an unscaled image and zoomed into the displayed one
+        self._frame = tkinter.PhotoImage(master=master, width=width, height=height)
+        self._img = tkinter.PhotoImage(master=master, width=width * screen_multiplier,
+                                       height=height * screen_multiplier)
+        self.create_image(0, 0, anchor="nw", image=self._img)
 
         # add the canvas to the master
         self.pack()
@@ -69,19 +131,19 @@ class Screen(tkinter.Canvas):
         :return: True if the pixel was previously set (1), False otherwise.
         :rtype: bool
         """
-        index = x + y * self._width
-        was_set = self._pixel[index] == 1
-        self._pixel[index] ^= 1
+        bit = 1 << (self._width - 1 - x)
+        was_set = bool(self._rows[y] & bit)
+        self._rows[y] ^= bit
+        self._dirty = True
         return was_set
 
     def is_pixel_set(self, x: int, y: int) -> bool:
         """
         Checks if a specific pixel at the given coordinates (x, y) is set or not.
 
-        The function determines whether a pixel is "set" based on a pre-defined internal
-        representation of the object's pixel array and the object's width. Pixels are
-        accessed via the equation ``x + y * self._width`` and the function returns
-        a boolean indicating the state of the pixel.
+        The function determines whether a pixel is "set" based on the bitmap of its row.
+        The pixel is the bit ``self._width - 1 - x`` of ``self._rows[y]`` and the function
+        returns a boolean indicating the state of the pixel.
 
         :param x: The horizontal coordinate of the pixel to check.
                   It indicates the column index in the 2D pixel representation.
@@ -92,12 +154,12 @@ class Screen(tkinter.Canvas):
         :return: ``True`` if the pixel at the specified coordinates is set, otherwise ``False``.
         :rtype: bool
         """
-        return bool(self._pixel[x + y * self._width])
+        return bool((self._rows[y] >> (self._width - 1 - x)) & 1)
 
-    def draw_sprite(self, x: int, y: int, sprite: bytearray) -> bool:
+    def draw_sprite(self, x: int, y: int, sprite: memoryview) -> bool:
         """
         Draws a sprite onto a display at the specified coordinates (x, y) using
-        the provided sprite data represented as a bytearray. The sprite's bits
+        the provided sprite data represented as a bytes-like object. The sprite's bits
         are drawn sequentially, with a bit value of `1` indicating an active
         pixel and a bit value of `0` leaving the pixel unchanged. If any
         existing pixels are unset as a result of this drawing operation (i.e.,
@@ -108,63 +170,63 @@ class Screen(tkinter.Canvas):
         :type x: int
         :param y: The y-coordinate where the sprite should be drawn.
         :type y: int
-        :param sprite: The sprite data to be drawn, represented as an advance
-           bytearray, where each byte corresponds to one horizontal 8-pixel
-           row of the sprite.
-        :type sprite: bytearray
+        :param sprite: The sprite data to be drawn, represented as a bytes-like
+           object such as a memoryview of the memory, where each byte corresponds
+           to one horizontal 8-pixel row of the sprite.
+        :type sprite: memoryview
         :return: A boolean indicating whether any previously set pixels were
             erased as a result of the drawing operation.
         :rtype: bool
         """
-        erased = False
-        for j, byte in enumerate(sprite):
-            for i in range(8):
-                if byte & (0x80 >> i):
-                    if self.set_pixel((x + i) % self._width, (y + j) % self._height):
-                        erased = True
-        return erased
+        self._dirty = True
+        return _draw_sprite(self._rows, self._width, self._height, x, y, sprite)
 
     def write_screen(self) -> None:
         """
-        Renders and displays the screen based on the current state of pixels. For each pixel
-        that is set, a rectangle is created on the canvas at the corresponding position.
+        Renders and displays the screen based on the current state of pixels. The whole
+        screen is put into the unscaled frame image as one Tcl list of row colors and
+        zoomed into the displayed image, so no canvas items are created per pixel.
+
+        Nothing is rendered if the screen did not change since the last rendered frame.
+        The rendering rate is set by the caller, which writes the screen once per frame.
         """
-        self.clear()
-        # Get a list of all pixels to draw
-        pixels_to_draw = self.compute_pixels_to_draw(self._height, self._width, self.is_pixel_set)
+        # skip unchanged screens
+        if not self._dirty:
+            return
+        self._dirty = False
 
-        for x, y in pixels_to_draw:
-            x1 = x * self._screen_multiplier
-            y1 = y * self._screen_multiplier
-            x2 = (x + 1) * self._pixel_size
-            y2 = (y + 1) * self._pixel_size
-            self.create_rectangle(x1, y1, x2, y2, fill="white", outline="")
+        # format every row as binary digits and translate them into a list of colors
+        digits = f"0{self._width}b"
+        rows = ["{" + format(row, digits).translate(_ROW_COLORS) + "}" for row in self._rows]
+        self._frame.put(" ".join(rows))
 
-        # Refresh the display
-        self.update_idletasks()
-        self.update()
+        # scale the frame into the displayed image
+        multiplier = self._screen_multiplier
+        self.tk.call(self._img, "copy", self._frame, "-zoom", multiplier, multiplier)
 
-    def compute_pixels_to_draw(self, height, width, is_pixel_set_func):
+    def schedule_frame(self, fn: Callable[[], None], delay_ms: int = 16) -> None:
         """
-        Precomputes all set pixels to draw using Numba for performance.
-        :param height: Screen height.
-        :param width: Screen width.
-        :param is_pixel_set_func: Function to check if a pixel is set (works as a callable).
-        :return: List of (x, y) coordinates for pixels to draw.
+        Schedules a function to run the next frame after a delay.
+
+        The function is called by the Tk event loop, which processes pending events and
+        redraws the window between two frames, so no frame drains the event queue itself.
+
+        :param fn: The function to call without arguments.
+        :type fn: Callable[[], None]
+        :param delay_ms: The delay before the function is called in milliseconds.
+        :type delay_ms: int
+        :return: None
         """
-        pixels = []
-        for y in range(height):
-            for x in range(width):
-                if is_pixel_set_func(x, y):
-                    pixels.append((x, y))
-        return pixels
+        self.master.after(delay_ms, fn)
 
     def clear(self):
         """
         Clear the screen to black
         :return:
         """
-        self.delete(tkinter.ALL)
+        self._frame.blank()
+        self._img.blank()
 
     def clear_screen_array(self) -> None:
-        self._pixel = bytearray(self._width * self._height)
+        self._rows = [0] * self._height
+        self._dirty = True
@@ -1,61 +1,63 @@
-from register import Register
+# the number of nested subroutine calls the stack can hold
+STACK_SIZE = 16
+
 
 class Stack:
     """
     Represents a stack data structure.
 
-    The Stack class is used to manage a stack stored as a bytearray. It interacts
-    with a provided Register object to manage the stack pointer (SP). The stack
-    supports basic push and pop operations within a limited size of 16 elements.
+    The Stack class is used to manage the return addresses of subroutine calls in a
+    plain list, using the list's own append and pop. The stack pointer (SP) is the
+    length of the list. The stack supports basic push and pop operations within a
+    limited size of 16 elements.
 
-    :ivar _stack: Internal storage for the stack, a bytearray of size 16.
+    :ivar _stack: Internal storage for the stack, a list of at most 16 addresses.
     :type _stack: list
-    :ivar _register: The Register instance used for stack pointer management.
-    :type _register: Register
     """
-    def __init__(self, register: Register) -> None:
+    __slots__ = ("_stack",)
+
+    def __init__(self) -> None:
+        """
+        Represents a simple stack implementation used to store the return addresses
+        of subroutine calls.
+
+        This class initializes an empty stack which grows up to a fixed size.
         """
-        Represents a simple stack implementation used to store data, alongside a
-        reference to a register object for additional operations.
+        self._stack = []
 
-        This class initializes a stack with a fixed size and associates it
-        with an external register instance upon creation.
+    @property
+    def sp(self) -> int:
+        """
+        The stack pointer, which is the number of values on the stack.
 
-        :param register: The external register instance to be used with this stack.
-        :type register: Register
+        :return: The number of values on the stack.
+        :rtype: int
         """
-        self._stack = [0] * 16
-        self._register = register
+        return len(self._stack)
 
     def pop(self) -> int:
         """
         Removes and returns the top element from the stack. If the stack is empty,
-        an exception is raised. This operation modifies the stack pointer by
-        decrementing its value before accessing the element at the adjusted stack
-        pointer index.
+        an exception is raised.
 
         :raises ValueError: If the stack is empty.
         :return: The integer value popped from the stack.
         :rtype: int
         """
-        if self._register.get_sp() == 0:
+        if not self._stack:
             raise ValueError("Stack is empty")
-        self._register.decrement_sp()
-        return self._stack[self._register.get_sp()]
+        return self._stack.pop()
 
     def push(self, value: int) -> None:
         """
         Pushes a value onto the stack. Ensures that the stack size remains within
-        defined limits by checking the stack pointer. If the stack has reached its
-        maximum size, an exception will be raised. The value is added to the position
-        indicated by the current stack pointer, and the stack pointer is incremented
-        afterward.
+        defined limits. If the stack has reached its maximum size, an exception
+        will be raised.
 
         :param value: The integer value to push onto the stack.
         :type value: int
         :raises ValueError: If the stack is full when attempting to push a value.
         """
-        if self._register.get_sp() == 15:
+        if len(self._stack) >= STACK_SIZE:
             raise ValueError("Stack is full")
-        self._stack[self._register.get_sp()] = value
-        self._register.increment_sp()
\ No newline at end of file
+        self._stack.append(value)